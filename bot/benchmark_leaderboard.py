@@ -0,0 +1,181 @@
+"""Benchmark: latência dos comandos de ranking/saldo usando o leaderboard em
+memória vs. consultar o site a cada comando.
+
+Sem cache, cada comando chamaria `/api/bot/leaderboard?top=K&user=ID`, que
+faz no banco o top-K e a posição de um usuário (como `getRichestUsers`).
+
+Por padrão sobe um servidor local que imita essa rota com usuários
+sintéticos, respondendo de estruturas já ordenadas (como um índice em
+`balance`) mais uma latência simulada por consulta ao banco. Com `--url`,
+usa o site de verdade (autenticando com CRON_SECRET).
+
+    python benchmark_leaderboard.py --users 20000 --requests 200
+    python benchmark_leaderboard.py --url http://localhost:3000
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+from bisect import bisect_left
+from datetime import datetime, timezone
+
+import aiohttp
+from aiohttp import web
+
+from leaderboard import Leaderboard
+
+TOP_K = 10
+
+
+def make_entries(count, seed=42):
+    rng = random.Random(seed)
+    return [
+        {
+            'discordId': str(100000000000000000 + i),
+            'name': f'Usuário {i}',
+            'balance': round(rng.uniform(0, 50000), 2),
+            'updatedAt': None,
+        }
+        for i in range(count)
+    ]
+
+
+async def start_mock_site(entries, db_latency):
+    ordered = sorted(entries, key=lambda entry: (-entry['balance'], entry['discordId']))
+    keys = [(-entry['balance'], entry['discordId']) for entry in ordered]
+    by_id = {entry['discordId']: entry for entry in entries}
+
+    async def top_query(limit):
+        await asyncio.sleep(db_latency)
+        return ordered[:limit]
+
+    async def rank_query(user_id):
+        # findOne da carteira e depois countDocuments dos que estão à frente
+        await asyncio.sleep(db_latency)
+        entry = by_id.get(user_id)
+        if entry is None:
+            return None
+        await asyncio.sleep(db_latency)
+        return dict(entry, rank=bisect_left(keys, (-entry['balance'], user_id)) + 1)
+
+    async def leaderboard(request):
+        top = request.query.get('top')
+        if top:
+            # Como a rota: top-K em paralelo com a posição do usuário
+            results, user = await asyncio.gather(top_query(int(top)), rank_query(request.query.get('user')))
+            return web.json_response({'success': True, 'top': results, 'user': user})
+
+        # Carga completa: uma agregação sobre todas as carteiras
+        await asyncio.sleep(db_latency)
+        return web.json_response({
+            'success': True,
+            'full': True,
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z'),
+            'entries': entries,
+        })
+
+    app = web.Application()
+    app.router.add_get('/api/bot/leaderboard', leaderboard)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f'http://127.0.0.1:{port}'
+
+
+async def fetch_entries(session, base_url, headers):
+    async with session.get(f'{base_url}/api/bot/leaderboard', headers=headers) as response:
+        response.raise_for_status()
+        return (await response.json())['entries']
+
+
+async def command_via_site(session, base_url, headers, user_id):
+    """O que o comando faria sem cache: top-K e posição do autor no site"""
+    params = {'top': str(TOP_K), 'user': user_id}
+    async with session.get(f'{base_url}/api/bot/leaderboard', headers=headers, params=params) as response:
+        response.raise_for_status()
+        data = await response.json()
+    return data['top'], (data['user'] or {}).get('rank')
+
+
+async def command_via_cache(leaderboard, user_id):
+    return leaderboard.top(TOP_K), leaderboard.rank(user_id)
+
+
+def summarize(label, samples):
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1] if len(samples) >= 20 else samples[-1]
+    print(f'{label:<24} média {statistics.mean(samples) * 1000:9.3f} ms | '
+          f'p50 {statistics.median(samples) * 1000:9.3f} ms | p95 {p95 * 1000:9.3f} ms')
+
+
+async def run(args):
+    runner = None
+    headers = {}
+    if args.url:
+        base_url = args.url.rstrip('/')
+        headers = {'Authorization': f"Bearer {os.getenv('CRON_SECRET')}"}
+    else:
+        runner, base_url = await start_mock_site(make_entries(args.users), args.db_latency / 1000)
+
+    try:
+        async with aiohttp.ClientSession() as session:
+            start = time.perf_counter()
+            entries = await fetch_entries(session, base_url, headers)
+            leaderboard = Leaderboard()
+            leaderboard.load(entries)
+            load_time = time.perf_counter() - start
+            print(f'{len(leaderboard)} usuários | carga inicial: {load_time * 1000:.1f} ms')
+
+            if not entries:
+                print('Nenhum saldo retornado pelo site.')
+                return
+
+            rng = random.Random(7)
+            user_ids = [rng.choice(entries)['discordId'] for _ in range(args.requests)]
+
+            site_samples = []
+            for user_id in user_ids:
+                start = time.perf_counter()
+                await command_via_site(session, base_url, headers, user_id)
+                site_samples.append(time.perf_counter() - start)
+
+            cache_samples = []
+            for user_id in user_ids:
+                start = time.perf_counter()
+                await command_via_cache(leaderboard, user_id)
+                cache_samples.append(time.perf_counter() - start)
+
+            # Alterações de saldo como as de uma resolução de partida
+            changes = [
+                dict(rng.choice(entries), balance=round(rng.uniform(0, 50000), 2))
+                for _ in range(args.changes)
+            ]
+            start = time.perf_counter()
+            leaderboard.apply(changes)
+            apply_time = time.perf_counter() - start
+
+        print(f'{args.requests} comandos (!ranking + posição do autor):')
+        summarize('site (top-K + posição)', site_samples)
+        summarize('leaderboard local', cache_samples)
+        print(f'aplicar {args.changes} alterações de saldo: {apply_time * 1000:.2f} ms')
+    finally:
+        if runner:
+            await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', help='URL do site (padrão: servidor simulado local)')
+    parser.add_argument('--users', type=int, default=10000, help='usuários sintéticos no servidor simulado')
+    parser.add_argument('--db-latency', type=float, default=5, help='latência simulada por consulta ao banco, em ms')
+    parser.add_argument('--requests', type=int, default=100, help='comandos medidos em cada modo')
+    parser.add_argument('--changes', type=int, default=500, help='alterações de saldo aplicadas ao cache')
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
@@ -135,6 +135,11 @@ class CronCommands(commands.Cog):
                         
                         embed.set_footer(text=f"Executado em {datetime.now().strftime('%H:%M:%S')}")
                         
+                        # O processamento resolve partidas e altera saldos. Só dispara quando
+                        # o bot executa o job; o cron da Vercel não avisa o bot
+                        if job_name.lower() == 'process':
+                            self.bot.dispatch('matches_processed')
+                        
                     else:
                         embed = discord.Embed(
                             title="❌ Erro na Execução",
@@ -0,0 +1,258 @@
+import discord
+from discord.ext import commands, tasks
+import aiohttp
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+
+from config import (
+    LEADERBOARD_REFRESH_INTERVAL,
+    LEADERBOARD_MAX_STALENESS,
+    LEADERBOARD_FULL_RELOAD_INTERVAL,
+    LEADERBOARD_TOP_K,
+    LEADERBOARD_RETRY_BACKOFF,
+    REQUEST_TIMEOUT
+)
+from leaderboard import Leaderboard
+from logger import get_logger, bind_context, new_trace_id
+
+# Cores para embeds
+COLORS = {
+    'success': 0x00ff00,
+    'error': 0xff0000,
+    'warning': 0xffff00,
+    'info': 0x0099ff,
+    'bet': 0xff6b35
+}
+
+# Margem ao pedir alterações, para não perder transações gravadas durante a última consulta
+DELTA_OVERLAP = timedelta(minutes=2)
+
+log = get_logger('timao.ranking')
+
+
+def format_balance(value):
+    return f"R$ {value:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
+
+
+class RankingCommands(commands.Cog):
+    """Ranking, saldo e perfil servidos do leaderboard em memória.
+
+    Os comandos são híbridos: atendem tanto `!ranking` quanto o `/ranking`
+    registrado pelo site (SLASH_COMMANDS em /api/bot/update). O bot não
+    sincroniza a árvore de comandos; só trata as interações recebidas.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.api_base_url = os.getenv('API_BASE_URL', 'http://localhost:3000')
+        self.cron_secret = os.getenv('CRON_SECRET')
+        self.leaderboard = Leaderboard()
+        self.since = None
+        self.last_failure = None
+        self._refresh_lock = asyncio.Lock()
+        # Outros cogs podem consultar o mesmo leaderboard
+        bot.leaderboard = self.leaderboard
+
+    async def cog_load(self):
+        self.refresh_leaderboard.start()
+
+    async def cog_unload(self):
+        self.refresh_leaderboard.cancel()
+
+    async def _fetch(self, since=None):
+        headers = {'Authorization': f'Bearer {self.cron_secret}'}
+        params = {'since': since} if since else None
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        async with self.bot.session.get(f"{self.api_base_url}/api/bot/leaderboard", headers=headers, params=params, timeout=timeout) as response:
+            if response.status != 200:
+                raise RuntimeError(f'Erro ao buscar leaderboard: {response.status}')
+            return await response.json()
+
+    async def refresh(self, force_full=False, max_age=None):
+        """Carga completa na primeira vez (ou periodicamente); depois só alterações.
+
+        Com `max_age` (usado pelos comandos), não faz nada se outra task já
+        atualizou o cache enquanto esta esperava o lock, nem se a última
+        tentativa falhou há menos de LEADERBOARD_RETRY_BACKOFF segundos.
+        """
+        async with self._refresh_lock:
+            if max_age is not None:
+                if not self.leaderboard.is_stale(max_age):
+                    return
+                if self.last_failure is not None and time.monotonic() - self.last_failure < LEADERBOARD_RETRY_BACKOFF:
+                    return
+            try:
+                await self._refresh(force_full)
+            except Exception:
+                self.last_failure = time.monotonic()
+                raise
+            self.last_failure = None
+
+    async def _refresh(self, force_full):
+        last_full = self.leaderboard.last_full_load
+        full = (
+            force_full
+            or last_full is None
+            or time.monotonic() - last_full > LEADERBOARD_FULL_RELOAD_INTERVAL
+        )
+
+        if full:
+            data = await self._fetch()
+            self.leaderboard.load(data.get('entries', []))
+            log.info('Leaderboard carregado: %s usuários', len(self.leaderboard))
+        else:
+            data = await self._fetch(self.since)
+            changed = self.leaderboard.apply(data.get('entries', []))
+            if changed:
+                log.info('Leaderboard atualizado: %s saldos alterados', changed)
+
+        timestamp = datetime.fromisoformat(data['timestamp'].replace('Z', '+00:00'))
+        self.since = (timestamp - DELTA_OVERLAP).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+    async def ensure_fresh(self):
+        """Atualizar antes de responder se o cache passou do limite de idade"""
+        if not self.leaderboard.is_stale(LEADERBOARD_MAX_STALENESS):
+            return
+        try:
+            await self.refresh(max_age=LEADERBOARD_MAX_STALENESS)
+        except Exception as e:
+            # Sem o site, responder com o que houver em cache
+            log.warning('Falha ao atualizar leaderboard, usando cache: %r', e)
+
+    @tasks.loop(seconds=LEADERBOARD_REFRESH_INTERVAL)
+    async def refresh_leaderboard(self):
+        """Buscar alterações de saldo no site (caminho normal de atualização)"""
+        bind_context(job='leaderboard_refresh', trace=new_trace_id())
+        try:
+            await self.refresh()
+        except Exception as e:
+            log.error('Erro ao atualizar leaderboard: %r', e)
+
+    @refresh_leaderboard.before_loop
+    async def before_refresh_leaderboard(self):
+        await self.bot.wait_until_ready()
+
+    @commands.Cog.listener()
+    async def on_matches_processed(self):
+        """Após `!cronrun process`, buscar as alterações na hora.
+
+        As resoluções do cron da Vercel não passam por aqui; essas chegam
+        pelo `refresh_leaderboard`.
+        """
+        try:
+            await self.refresh()
+        except Exception as e:
+            log.error('Erro ao atualizar leaderboard após partidas: %r', e)
+
+    def _unavailable_embed(self):
+        """Cache ainda não carregado (site fora do ar no início ou em backoff)"""
+        return discord.Embed(
+            title="⚠️ Ranking indisponível",
+            description="Não foi possível carregar os saldos do site. Tente novamente em instantes.",
+            color=COLORS['warning']
+        )
+
+    def _set_footer(self, embed):
+        embed.set_footer(text=f"Atualizado há {int(self.leaderboard.age())}s")
+
+    @commands.hybrid_command(name='ranking')
+    async def ranking(self, ctx):
+        """Ranking de apostadores por saldo"""
+        await ctx.defer()
+        await self.ensure_fresh()
+
+        if self.leaderboard.age() is None:
+            await ctx.send(embed=self._unavailable_embed())
+            return
+
+        embed = discord.Embed(
+            title="🏆 Ranking de Apostadores",
+            color=COLORS['bet'],
+            timestamp=datetime.now()
+        )
+
+        top = self.leaderboard.top(LEADERBOARD_TOP_K)
+        if top:
+            medals = {1: '🥇', 2: '🥈', 3: '🥉'}
+            lines = [
+                f"{medals.get(position, f'`{position}.`')} **{entry['name']}** - {format_balance(entry['balance'])}"
+                for position, entry in enumerate(top, start=1)
+            ]
+            embed.description = "\n".join(lines)
+        else:
+            embed.description = "Nenhum apostador encontrado."
+
+        rank = self.leaderboard.rank(ctx.author.id)
+        if rank is not None and rank > LEADERBOARD_TOP_K:
+            embed.add_field(name="Sua posição", value=f"#{rank} de {len(self.leaderboard)}", inline=False)
+
+        self._set_footer(embed)
+        await ctx.send(embed=embed)
+
+    @commands.hybrid_command(name='balance', aliases=['saldo'])
+    async def balance(self, ctx):
+        """Ver saldo atual"""
+        await ctx.defer()
+        await self.ensure_fresh()
+
+        # Sem a primeira carga, a ausência do usuário não significa que ele não tem carteira
+        if self.leaderboard.age() is None:
+            await ctx.send(embed=self._unavailable_embed())
+            return
+
+        entry = self.leaderboard.get(ctx.author.id)
+        if entry is None:
+            embed = discord.Embed(
+                title="❌ Carteira não encontrada",
+                description="Faça login no site para criar sua carteira.",
+                color=COLORS['error']
+            )
+            await ctx.send(embed=embed)
+            return
+
+        embed = discord.Embed(
+            title="💰 Saldo",
+            description=f"**{format_balance(entry['balance'])}**",
+            color=COLORS['success']
+        )
+        embed.add_field(name="Posição", value=f"#{self.leaderboard.rank(ctx.author.id)} de {len(self.leaderboard)}", inline=True)
+        self._set_footer(embed)
+        await ctx.send(embed=embed)
+
+    @commands.hybrid_command(name='profile', aliases=['perfil'])
+    async def profile(self, ctx, member: discord.Member = None):
+        """Ver saldo e posição no ranking de um membro"""
+        await ctx.defer()
+        await self.ensure_fresh()
+
+        if self.leaderboard.age() is None:
+            await ctx.send(embed=self._unavailable_embed())
+            return
+
+        member = member or ctx.author
+        entry = self.leaderboard.get(member.id)
+        if entry is None:
+            embed = discord.Embed(
+                title="❌ Perfil não encontrado",
+                description=f"{member.display_name} ainda não tem carteira no site.",
+                color=COLORS['error']
+            )
+            await ctx.send(embed=embed)
+            return
+
+        # Só saldo e posição: nível e VIP não fazem parte do leaderboard
+        embed = discord.Embed(
+            title=f"👤 {entry['name']}",
+            color=COLORS['info']
+        )
+        embed.set_thumbnail(url=member.display_avatar.url)
+        embed.add_field(name="Saldo", value=format_balance(entry['balance']), inline=True)
+        embed.add_field(name="Ranking", value=f"#{self.leaderboard.rank(member.id)} de {len(self.leaderboard)}", inline=True)
+        self._set_footer(embed)
+        await ctx.send(embed=embed)
+
+
+async def setup(bot):
+    await bot.add_cog(RankingCommands(bot))
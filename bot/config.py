@@ -80,6 +80,12 @@ ADMIN_ROLES = ['Admin', 'Moderador', 'Bot Manager']
 # Configurações de logs
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 LOG_FILE = os.getenv('LOG_FILE', 'bot.log')
+LOG_MAX_BYTES = int(os.getenv('LOG_MAX_BYTES', 5 * 1024 * 1024))  # rotação a cada 5 MB
+LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', 5))
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', 10000))  # registros em memória antes de descartar
+LOG_RATE_LIMIT_WINDOW = float(os.getenv('LOG_RATE_LIMIT_WINDOW', 60))  # segundos
+LOG_RATE_LIMIT_BURST = int(os.getenv('LOG_RATE_LIMIT_BURST', 5))  # erros idênticos por janela
+LOG_SAMPLE_RATE = int(os.getenv('LOG_SAMPLE_RATE', 50))  # depois do burst, manter 1 a cada N
 
 # Configurações de timeout
 REQUEST_TIMEOUT = 30  # segundos
@@ -88,6 +94,13 @@ RETRY_ATTEMPTS = 3
 # Configurações de cache
 CACHE_DURATION = 300  # 5 minutos
 
+# Configurações do leaderboard (ranking/saldo servidos do cache do bot)
+LEADERBOARD_REFRESH_INTERVAL = int(os.getenv('LEADERBOARD_REFRESH_INTERVAL', 60))  # segundos entre buscas de alterações
+LEADERBOARD_MAX_STALENESS = int(os.getenv('LEADERBOARD_MAX_STALENESS', 300))  # idade máxima antes de um comando forçar atualização
+LEADERBOARD_FULL_RELOAD_INTERVAL = int(os.getenv('LEADERBOARD_FULL_RELOAD_INTERVAL', 6 * 3600))  # recarga completa periódica
+LEADERBOARD_TOP_K = int(os.getenv('LEADERBOARD_TOP_K', 10))  # posições exibidas no !ranking
+LEADERBOARD_RETRY_BACKOFF = int(os.getenv('LEADERBOARD_RETRY_BACKOFF', 60))  # após falha, comandos usam o cache por N segundos
+
 # Validação de configuração
 def validate_config():
     """Validar se todas as configurações necessárias estão presentes"""
@@ -0,0 +1,82 @@
+import time
+from bisect import bisect_left, insort
+
+
+class Leaderboard:
+    """Ranking de saldos mantido em memória pelo bot.
+
+    Os usuários ficam numa lista ordenada por (-saldo, id), então o top-K é
+    um fatiamento e a posição de qualquer usuário sai de uma busca binária
+    (O(log n)) usando o índice por id. É carregado de uma vez com `load` e
+    atualizado com as alterações de saldo recebidas em `apply`.
+    """
+
+    def __init__(self):
+        self._keys = []      # [(-saldo, user_id)] sempre ordenada
+        self._entries = {}   # user_id -> dados do usuário
+        self.last_full_load = None
+        self.last_update = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, user_id):
+        return str(user_id) in self._entries
+
+    @staticmethod
+    def _key(entry):
+        return (-entry['balance'], entry['discordId'])
+
+    def load(self, entries):
+        """Substituir todo o ranking pela carga completa do site"""
+        self._entries = {str(entry['discordId']): dict(entry, discordId=str(entry['discordId'])) for entry in entries}
+        self._keys = sorted(self._key(entry) for entry in self._entries.values())
+        self.last_full_load = self.last_update = time.monotonic()
+
+    def apply(self, entries):
+        """Aplicar alterações de saldo; retorna quantos usuários mudaram"""
+        changed = 0
+        for entry in entries:
+            user_id = str(entry['discordId'])
+            entry = dict(entry, discordId=user_id)
+            current = self._entries.get(user_id)
+
+            if current is not None:
+                if current == entry:
+                    continue
+                old_key = self._key(current)
+                index = bisect_left(self._keys, old_key)
+                if index < len(self._keys) and self._keys[index] == old_key:
+                    del self._keys[index]
+
+            self._entries[user_id] = entry
+            insort(self._keys, self._key(entry))
+            changed += 1
+
+        self.last_update = time.monotonic()
+        return changed
+
+    def get(self, user_id):
+        """Dados do usuário, ou None se ele não tiver carteira"""
+        return self._entries.get(str(user_id))
+
+    def rank(self, user_id):
+        """Posição (1 = maior saldo) do usuário, ou None"""
+        entry = self._entries.get(str(user_id))
+        if entry is None:
+            return None
+        return bisect_left(self._keys, self._key(entry)) + 1
+
+    def top(self, k=10):
+        """Os k maiores saldos, em ordem"""
+        return [self._entries[user_id] for _, user_id in self._keys[:k]]
+
+    def age(self):
+        """Segundos desde a última atualização (None se nunca carregado)"""
+        if self.last_update is None:
+            return None
+        return time.monotonic() - self.last_update
+
+    def is_stale(self, max_age):
+        age = self.age()
+        return age is None or age > max_age
@@ -0,0 +1,261 @@
+import contextvars
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+from config import (
+    LOG_LEVEL,
+    LOG_FILE,
+    LOG_MAX_BYTES,
+    LOG_BACKUP_COUNT,
+    LOG_QUEUE_SIZE,
+    LOG_RATE_LIMIT_WINDOW,
+    LOG_RATE_LIMIT_BURST,
+    LOG_SAMPLE_RATE
+)
+
+# Campos estruturados presentes em todos os registros
+CONTEXT_FIELDS = ('job', 'command', 'guild', 'trace')
+
+# Contexto da task atual (cada comando/loop roda na sua própria task do asyncio)
+_log_context = contextvars.ContextVar('log_context', default={})
+
+_listener = None
+
+
+def new_trace_id():
+    """Gerar um identificador curto para correlacionar registros"""
+    return uuid.uuid4().hex[:12]
+
+
+def bind_context(**fields):
+    """Associar campos (job, command, guild, trace) aos logs da task atual.
+
+    Retorna o token para desfazer com `reset_context`.
+    """
+    context = dict(_log_context.get())
+    context.update({key: value for key, value in fields.items() if value is not None})
+    return _log_context.set(context)
+
+
+def reset_context(token):
+    """Restaurar o contexto anterior a `bind_context`"""
+    _log_context.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """Copiar o contexto da task para o registro antes de ir para a fila"""
+
+    def filter(self, record):
+        context = _log_context.get()
+        for field in CONTEXT_FIELDS:
+            if getattr(record, field, None) is None:
+                setattr(record, field, context.get(field))
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """Limitar erros repetidos (ex.: a mesma falha da API a cada volta do loop).
+
+    Dentro de cada janela, os primeiros `burst` registros idênticos passam;
+    depois disso só 1 a cada `sample_rate` é mantido. O registro seguinte
+    carrega em `suppressed` quantos foram descartados.
+    """
+
+    def __init__(self, window=60.0, burst=5, sample_rate=50, level=logging.WARNING):
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self.sample_rate = max(1, sample_rate)
+        self.level = level
+        self._state = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno < self.level:
+            return True
+
+        key = (record.name, record.levelno, record.pathname, record.lineno, record.getMessage())
+        now = time.monotonic()
+
+        with self._lock:
+            state = self._state.get(key)
+            if state is None or now - state['start'] >= self.window:
+                suppressed = state['suppressed'] if state else 0
+                self._state[key] = {'start': now, 'count': 1, 'suppressed': 0}
+                self._prune(now)
+                if suppressed:
+                    record.suppressed = suppressed
+                return True
+
+            state['count'] += 1
+            over_burst = state['count'] - self.burst
+            if over_burst <= 0 or over_burst % self.sample_rate == 0:
+                if state['suppressed']:
+                    record.suppressed = state['suppressed']
+                    state['suppressed'] = 0
+                return True
+
+            state['suppressed'] += 1
+            return False
+
+    def _prune(self, now):
+        """Remover chaves antigas para o dicionário não crescer sem limite"""
+        if len(self._state) < 1024:
+            return
+        expired = [key for key, state in self._state.items() if now - state['start'] >= self.window]
+        for key in expired:
+            del self._state[key]
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler com fila limitada que descarta registros de baixa prioridade.
+
+    Abaixo de `priority_level`, os registros são descartados quando a fila
+    passa de `soft_ratio` da capacidade, deixando espaço para avisos e erros.
+    Registros prioritários só são descartados com a fila cheia. Nunca bloqueia.
+    """
+
+    def __init__(self, log_queue, priority_level=logging.WARNING, soft_ratio=0.8):
+        super().__init__(log_queue)
+        self.priority_level = priority_level
+        self.soft_limit = max(1, int(log_queue.maxsize * soft_ratio)) if log_queue.maxsize > 0 else 0
+        self.dropped = 0
+        self._drop_lock = threading.Lock()
+
+    def prepare(self, record):
+        # Resolver mensagem e traceback aqui, pois os argumentos e frames não
+        # devem atravessar para a thread de escrita
+        record = logging.makeLogRecord(record.__dict__)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.stack_info = None
+        return record
+
+    def enqueue(self, record):
+        if (self.soft_limit and record.levelno < self.priority_level
+                and self.queue.qsize() >= self.soft_limit):
+            self._count_drop()
+            return
+
+        with self._drop_lock:
+            dropped, self.dropped = self.dropped, 0
+        if dropped:
+            record.dropped = dropped
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._count_drop(dropped)
+
+    def _count_drop(self, amount=0):
+        with self._drop_lock:
+            self.dropped += amount + 1
+
+
+class BoundedQueueListener(logging.handlers.QueueListener):
+    """QueueListener que aguarda espaço na fila para o sinal de parada"""
+
+    def enqueue_sentinel(self):
+        # Com a fila cheia, put_nowait falharia; a thread de escrita abre espaço
+        self.queue.put(self._sentinel)
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatar registros como uma linha JSON"""
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+
+        for field in CONTEXT_FIELDS:
+            entry[field] = getattr(record, field, None)
+
+        for field in ('suppressed', 'dropped'):
+            value = getattr(record, field, None)
+            if value:
+                entry[field] = value
+
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc'] = record.exc_text
+
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def setup_logging():
+    """Configurar o logging do bot.
+
+    Os handlers do loop só enfileiram; console, arquivo e rotação rodam
+    na thread do QueueListener.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    formatter = JsonFormatter()
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+    handlers = [console_handler]
+
+    if LOG_FILE:
+        file_handler = logging.handlers.RotatingFileHandler(
+            LOG_FILE,
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
+            encoding='utf-8',
+            delay=True
+        )
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    queue_handler = BoundedQueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+    queue_handler.addFilter(RateLimitFilter(
+        window=LOG_RATE_LIMIT_WINDOW,
+        burst=LOG_RATE_LIMIT_BURST,
+        sample_rate=LOG_SAMPLE_RATE
+    ))
+
+    root = logging.getLogger()
+    root.handlers.clear()
+    root.addHandler(queue_handler)
+    level = logging.getLevelName(LOG_LEVEL.upper())
+    root.setLevel(level if isinstance(level, int) else logging.INFO)
+
+    _listener = BoundedQueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """Esvaziar a fila e parar a thread de escrita"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+def get_logger(name):
+    """Obter um logger do bot"""
+    return logging.getLogger(name)
@@ -6,6 +6,7 @@ import asyncio
 from datetime import datetime, timedelta
 import aiohttp
 from dotenv import load_dotenv
+from logger import setup_logging, shutdown_logging, get_logger, bind_context, new_trace_id
 
 # Carregar variáveis de ambiente
 load_dotenv()
@@ -42,6 +43,8 @@ COLORS = {
     'quiz': 0x9b59b6
 }
 
+log = get_logger('timao.bot')
+
 class TimaoBot(commands.Bot):
     def __init__(self):
         super().__init__(
@@ -54,13 +57,14 @@ class TimaoBot(commands.Bot):
         
     async def setup_hook(self):
         """Configuração inicial do bot"""
-        print(f'🤖 Bot {self.user} está inicializando...')
+        log.info('Bot %s está inicializando...', self.user)
         
         # Criar sessão HTTP
         self.session = aiohttp.ClientSession()
         
         # Carregar comandos
         await self.load_extension('comandos.cron')
+        await self.load_extension('comandos.ranking')
         # await self.load_extension('comandos.bet')
         # await self.load_extension('comandos.profile')
         # await self.load_extension('comandos.news')
@@ -74,7 +78,7 @@ class TimaoBot(commands.Bot):
         self.sync_commands.start()
         self.health_check.start()
         
-        print('✅ Bot inicializado com sucesso!')
+        log.info('Bot inicializado com sucesso!')
     
     async def close(self):
         """Limpeza ao fechar o bot"""
@@ -85,49 +89,58 @@ class TimaoBot(commands.Bot):
     @tasks.loop(hours=1)
     async def sync_commands(self):
         """Sincronizar comandos com o site"""
+        bind_context(job='sync_commands', trace=new_trace_id())
         try:
             headers = {'Authorization': f'Bearer {CRON_SECRET}'}
             
             # Primeiro testar se a API está funcionando
             async with self.session.get(f'{API_BASE_URL}/api/bot/test', headers=headers) as test_response:
                 if test_response.status != 200:
-                    print(f'❌ API não está acessível: {test_response.status}')
+                    log.error('API não está acessível: %s', test_response.status)
                     return
             
             # Se o teste passou, tentar sincronizar comandos
             async with self.session.post(f'{API_BASE_URL}/api/bot/update', headers=headers) as response:
                 if response.status == 200:
                     data = await response.json()
-                    print(f'✅ Comandos sincronizados: {data.get("commandsUpdated", 0)} comandos')
+                    log.info('Comandos sincronizados: %s comandos', data.get("commandsUpdated", 0))
                 else:
-                    print(f'❌ Erro ao sincronizar comandos: {response.status}')
+                    log.error('Erro ao sincronizar comandos: %s', response.status)
         except Exception as e:
-            print(f'❌ Erro na sincronização: {e}')
+            log.error('Erro na sincronização: %s', e)
     
     @tasks.loop(minutes=30)
     async def health_check(self):
         """Verificar saúde do bot e conexão com o site"""
+        bind_context(job='health_check', trace=new_trace_id())
         try:
             headers = {'Authorization': f'Bearer {CRON_SECRET}'}
             
             # Testar endpoint de sync
             async with self.session.get(f'{API_BASE_URL}/api/bot/sync', headers=headers) as response:
                 if response.status == 200:
-                    print(f'✅ Health check: {datetime.now().strftime("%H:%M:%S")}')
+                    log.info('Health check: %s', datetime.now().strftime("%H:%M:%S"))
                 else:
-                    print(f'⚠️ Health check falhou: {response.status}')
+                    log.warning('Health check falhou: %s', response.status)
         except Exception as e:
-            print(f'❌ Health check erro: {e}')
+            log.error('Health check erro: %s', e)
 
 bot = TimaoBot()
 
 # Eventos do bot
+@bot.before_invoke
+async def bind_command_context(ctx):
+    """Associar comando, servidor e trace aos logs da invocação"""
+    bind_context(
+        command=ctx.command.qualified_name if ctx.command else None,
+        guild=ctx.guild.id if ctx.guild else None,
+        trace=new_trace_id()
+    )
+
 @bot.event
 async def on_ready():
     """Evento quando o bot está pronto"""
-    print(f'🎉 {bot.user} está online!')
-    print(f'📊 Servidores: {len(bot.guilds)}')
-    print(f'👥 Usuários: {len(bot.users)}')
+    log.info('%s está online! Servidores: %s, Usuários: %s', bot.user, len(bot.guilds), len(bot.users))
     
     # Definir status do bot
     await bot.change_presence(
@@ -162,6 +175,7 @@ async def on_command_error(ctx, error):
         return
     
     # Erro genérico
+    log.error('Erro no comando: %s', error, exc_info=error)
     embed = discord.Embed(
         title="❌ Erro",
         description=f"Ocorreu um erro: {str(error)}",
@@ -205,7 +219,7 @@ async def help_command(ctx):
     
     embed.add_field(
         name="👤 Perfil",
-        value="`/profile` - Ver perfil e estatísticas",
+        value="`/profile` - Ver saldo e posição no ranking",
         inline=False
     )
     
@@ -276,20 +290,25 @@ async def atualiza_partidas(ctx):
 # Função principal
 def main():
     """Função principal para iniciar o bot"""
-    if not BOT_TOKEN:
-        print("❌ DISCORD_BOT_TOKEN não configurado!")
-        return
-    
-    if not CLIENT_ID:
-        print("❌ DISCORD_CLIENT_ID não configurado!")
-        return
-    
+    setup_logging()
     try:
-        bot.run(BOT_TOKEN)
-    except discord.LoginFailure:
-        print("❌ Token do bot inválido!")
-    except Exception as e:
-        print(f"❌ Erro ao iniciar bot: {e}")
+        if not BOT_TOKEN:
+            log.critical("DISCORD_BOT_TOKEN não configurado!")
+            return
+
+        if not CLIENT_ID:
+            log.critical("DISCORD_CLIENT_ID não configurado!")
+            return
+
+        try:
+            # log_handler=None: usar a configuração de logging do bot
+            bot.run(BOT_TOKEN, log_handler=None)
+        except discord.LoginFailure:
+            log.critical("Token do bot inválido!")
+        except Exception as e:
+            log.critical("Erro ao iniciar bot: %s", e, exc_info=True)
+    finally:
+        shutdown_logging()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -93,6 +93,7 @@ export async function claimDailyReward(): Promise<{ success: boolean; message: s
                 { userId },
                 {
                     $inc: { balance: DAILY_REWARD_AMOUNT },
+                    $set: { updatedAt: new Date() },
                     $push: { transactions: { $each: [newTransaction], $sort: { date: -1 } } },
                 },
                 { session: mongoSession, upsert: true }
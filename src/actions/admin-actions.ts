@@ -682,6 +682,7 @@ export async function resolveMatch(fixtureId: number, options: { revalidate: boo
                             { userId: bet.userId },
                             {
                                 $inc: { balance: winnings },
+                                $set: { updatedAt: new Date() },
                                 $push: { transactions: { $each: [newTransaction], $sort: { date: -1 } } },
                             },
                             { session: mongoSession }
@@ -721,7 +722,7 @@ export async function resolveMatch(fixtureId: number, options: { revalidate: boo
                                        };
                                        await walletsCollection.updateOne(
                                            { userId: bet.userId },
-                                           { $inc: { balance: levelReward.rewardAmount }, $push: { transactions: { $each: [moneyRewardTx], $sort: { date: -1 } } } },
+                                           { $inc: { balance: levelReward.rewardAmount }, $set: { updatedAt: new Date() }, $push: { transactions: { $each: [moneyRewardTx], $sort: { date: -1 } } } },
                                            { session: mongoSession }
                                        );
                                        rewardDescription = ` Você ganhou uma recompensa de R$ ${levelReward.rewardAmount.toFixed(2)}!`;
@@ -820,6 +821,7 @@ export async function resolveMatch(fixtureId: number, options: { revalidate: boo
                             { userId: winner.userId },
                             {
                                 $inc: { balance: prizePerWinner },
+                                $set: { updatedAt: new Date() },
                                 $push: { transactions: { $each: [prizeTransaction], $sort: { date: -1 } } },
                             },
                             { session: mongoSession }
@@ -865,6 +867,7 @@ export async function resolveMatch(fixtureId: number, options: { revalidate: boo
                             { userId: participant.userId },
                             {
                                 $inc: { balance: activeBolao.entryFee },
+                                $set: { updatedAt: new Date() },
                                 $push: { transactions: { $each: [refundTransaction], $sort: { date: -1 } } },
                             },
                             { session: mongoSession }
@@ -1455,6 +1458,7 @@ export async function cancelMvpVoting(votingId: string): Promise<{ success: bool
                     { userId: vote.userId },
                     {
                         $inc: { balance: debitAmount },
+                        $set: { updatedAt: new Date() },
                         $push: { transactions: { $each: [newTransaction], $sort: { date: -1 } } },
                     },
                     { session: mongoSession }
@@ -1872,7 +1876,7 @@ export async function refundPurchase(inventoryId: string): Promise<{ success: bo
             // Refund the user
             await walletsCollection.updateOne(
                 { userId: purchase.userId },
-                { $inc: { balance: purchase.pricePaid } },
+                { $inc: { balance: purchase.pricePaid }, $set: { updatedAt: new Date() } },
                 { session: mongoSession }
             );
 
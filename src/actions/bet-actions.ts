@@ -116,7 +116,7 @@ export async function placeBet(betsInSlip: BetInSlip[], stake: number): Promise<
       await walletsCollection.updateOne(
         { userId },
         {
-          $set: { balance: newBalance },
+          $set: { balance: newBalance, updatedAt: new Date() },
           $push: { transactions: { $each: [newTransaction], $sort: { date: -1 } } },
         },
         { session: mongoSession }
@@ -205,7 +205,7 @@ export async function joinBolao(bolaoId: string, guess: { home: number, away: nu
             await walletsCollection.updateOne(
                 { userId: discordId },
                 {
-                    $set: { balance: newBalance },
+                    $set: { balance: newBalance, updatedAt: new Date() },
                     $push: { transactions: { $each: [newTransaction], $sort: { date: -1 } } },
                 },
                 { session: mongoSession }
@@ -288,6 +288,7 @@ export async function cancelBolao(bolaoId: string): Promise<{ success: boolean;
                     { userId: participant.userId },
                     {
                         $inc: { balance: refundAmount },
+                        $set: { updatedAt: new Date() },
                         $push: { transactions: { $each: [newTransaction], $sort: { date: -1 } } },
                     },
                     { session: mongoSession }
@@ -88,6 +88,7 @@ export async function castVote(votingId: string, playerId: number): Promise<{ su
                 { userId: discordId },
                 {
                     $inc: { balance: VOTE_REWARD },
+                    $set: { updatedAt: new Date() },
                     $push: { transactions: { $each: [newTransaction], $sort: { date: -1 } } },
                 },
                 { session: mongoSession }
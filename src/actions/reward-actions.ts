@@ -85,6 +85,7 @@ export async function redeemCode(code: string): Promise<{ success: boolean; mess
                     { userId },
                     {
                         $inc: { balance: amount },
+                        $set: { updatedAt: new Date() },
                         $push: { transactions: { $each: [newTransaction], $sort: { date: -1 } } },
                     },
                     { upsert: true, session: mongoSession }
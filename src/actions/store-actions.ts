@@ -215,7 +215,7 @@ export async function purchaseItem(itemId: string): Promise<PurchaseResult> {
             await walletsCollection.updateOne(
                 { userId },
                 {
-                    $set: { balance: newBalance },
+                    $set: { balance: newBalance, updatedAt: new Date() },
                     $push: { transactions: { $each: [newTransaction], $sort: { date: -1 } } }
                 },
                 { session: mongoSession }
@@ -223,7 +223,8 @@ export const authOptions: AuthOptions = {
           await walletsCollection.insertOne({
             userId: userId,
             balance: bonusAmount,
-            transactions: [initialTransaction]
+            transactions: [initialTransaction],
+            updatedAt: new Date()
           });
 
           const notificationsCollection = db.collection("notifications");
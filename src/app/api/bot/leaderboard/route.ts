@@ -0,0 +1,43 @@
+import { NextResponse } from 'next/server';
+import { getBalanceSnapshot, getTopBalances } from '@/lib/leaderboard';
+
+// Carga inicial (sem `since`) e alterações incrementais de saldo para o leaderboard do bot.
+// Com `top` (e opcionalmente `user`), responde direto do banco: top-K e posição do usuário.
+export async function GET(request: Request) {
+  const authHeader = request.headers.get('authorization');
+  if (authHeader !== `Bearer ${process.env.CRON_SECRET}`) {
+    return new Response('Unauthorized', { status: 401 });
+  }
+
+  try {
+    const params = new URL(request.url).searchParams;
+
+    const top = params.get('top');
+    if (top) {
+      const limit = parseInt(top, 10);
+      if (isNaN(limit) || limit < 1 || limit > 100) {
+        return NextResponse.json({ success: false, message: 'Parâmetro top inválido (1-100)' }, { status: 400 });
+      }
+      const result = await getTopBalances(limit, params.get('user') ?? undefined);
+      return NextResponse.json({ success: true, ...result });
+    }
+
+    const since = params.get('since') ?? undefined;
+    if (since && isNaN(Date.parse(since))) {
+      return NextResponse.json({ success: false, message: 'Parâmetro since inválido' }, { status: 400 });
+    }
+    // Marcar o horário antes da consulta para o bot não perder alterações feitas durante ela
+    const timestamp = new Date().toISOString();
+    const entries = await getBalanceSnapshot(since);
+
+    return NextResponse.json({
+      success: true,
+      full: !since,
+      timestamp,
+      entries
+    });
+  } catch (error) {
+    console.error('Erro ao buscar saldos para o leaderboard:', error);
+    return NextResponse.json({ success: false, message: 'Erro ao buscar saldos', error: (error as Error).message }, { status: 500 });
+  }
+}
@@ -0,0 +1,123 @@
+import clientPromise from '@/lib/mongodb';
+import type { BalanceEntry } from '@/types';
+
+// Consultas usadas só pela API do bot. Ficam fora de src/actions de propósito:
+// arquivos 'use server' viram server actions que qualquer visitante pode chamar,
+// e estes dados só podem sair pela rota protegida por CRON_SECRET.
+
+// Saldos para o leaderboard do bot. Sem `since`, retorna todas as carteiras;
+// com `since` (ISO), apenas as alteradas depois dessa data. Toda escrita em
+// `wallets` que muda o saldo precisa atualizar `updatedAt` para aparecer aqui.
+export async function getBalanceSnapshot(since?: string): Promise<BalanceEntry[]> {
+    try {
+        const client = await clientPromise;
+        const db = client.db('timaocord');
+        const walletsCollection = db.collection('wallets');
+
+        const match = since ? { updatedAt: { $gt: new Date(since) } } : {};
+
+        const entries = await walletsCollection.aggregate([
+            { $match: match },
+            {
+                $lookup: {
+                    from: 'users',
+                    localField: 'userId',
+                    foreignField: 'discordId',
+                    as: 'userDetails'
+                }
+            },
+            { $unwind: { path: '$userDetails', preserveNullAndEmptyArrays: true } },
+            {
+                $project: {
+                    _id: 0,
+                    discordId: '$userId',
+                    name: '$userDetails.name',
+                    balance: 1,
+                    updatedAt: 1,
+                }
+            }
+        ]).toArray();
+
+        return entries
+            .filter(entry => entry.discordId)
+            .map(entry => ({
+                discordId: entry.discordId as string,
+                name: (entry.name as string) ?? 'Desconhecido',
+                balance: (entry.balance as number) ?? 0,
+                updatedAt: entry.updatedAt ? (entry.updatedAt as Date).toISOString() : null,
+            }));
+
+    } catch (error) {
+        console.error('Error fetching balance snapshot:', error);
+        throw error;
+    }
+}
+
+// Top-K e posição de um usuário direto no banco, como o site responderia a
+// cada comando sem o cache do bot. Empates seguem a mesma ordem do bot
+// (maior saldo primeiro, depois o menor discordId).
+export async function getTopBalances(limit: number, userId?: string): Promise<{ top: BalanceEntry[]; user: (BalanceEntry & { rank: number }) | null }> {
+    try {
+        const client = await clientPromise;
+        const db = client.db('timaocord');
+        const walletsCollection = db.collection('wallets');
+
+        const topPromise = walletsCollection.aggregate([
+            { $sort: { balance: -1, userId: 1 } },
+            { $limit: limit },
+            {
+                $lookup: {
+                    from: 'users',
+                    localField: 'userId',
+                    foreignField: 'discordId',
+                    as: 'userDetails'
+                }
+            },
+            { $unwind: { path: '$userDetails', preserveNullAndEmptyArrays: true } },
+            {
+                $project: {
+                    _id: 0,
+                    discordId: '$userId',
+                    name: '$userDetails.name',
+                    balance: 1,
+                    updatedAt: 1,
+                }
+            }
+        ]).toArray();
+
+        const userPromise = (async () => {
+            if (!userId) return null;
+            const wallet = await walletsCollection.findOne({ userId });
+            if (!wallet) return null;
+            const ahead = await walletsCollection.countDocuments({
+                $or: [
+                    { balance: { $gt: wallet.balance } },
+                    { balance: wallet.balance, userId: { $lt: userId } },
+                ]
+            });
+            return {
+                discordId: userId,
+                name: '',
+                balance: (wallet.balance as number) ?? 0,
+                updatedAt: wallet.updatedAt ? (wallet.updatedAt as Date).toISOString() : null,
+                rank: ahead + 1,
+            };
+        })();
+
+        const [top, user] = await Promise.all([topPromise, userPromise]);
+
+        return {
+            top: top.map(entry => ({
+                discordId: entry.discordId as string,
+                name: (entry.name as string) ?? 'Desconhecido',
+                balance: (entry.balance as number) ?? 0,
+                updatedAt: entry.updatedAt ? (entry.updatedAt as Date).toISOString() : null,
+            })),
+            user,
+        };
+
+    } catch (error) {
+        console.error('Error fetching top balances:', error);
+        throw error;
+    }
+}
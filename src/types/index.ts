@@ -124,6 +124,13 @@ export type RichestUserRanking = {
   isVip?: boolean;
 };
 
+export type BalanceEntry = {
+  discordId: string;
+  name: string;
+  balance: number;
+  updatedAt: string | null;
+};
+
 export type LevelThreshold = {
     level: number;
     xp: number;
@@ -156,6 +163,7 @@ export type Wallet = {
     userId: string;
     balance: number;
     transactions: Transaction[];
+    updatedAt?: Date;
 };
 
 export type StoreItem = {